@@ -14,7 +14,7 @@
 # =========================================================================================================
 
 import numpy as np
-from scipy.spatial.distance import cdist
+from scipy.spatial.distance import cdist, pdist, squareform
 
 from pymoo.algorithms.base.genetic import GeneticAlgorithm
 from pymoo.core.duplicate import DefaultDuplicateElimination
@@ -27,132 +27,199 @@ from pymoo.operators.sampling.rnd import FloatRandomSampling
 from pymoo.util.display import MultiObjectiveDisplay
 
 import math
-from pymoo.util.nds.non_dominated_sorting import NonDominatedSorting
-from pymoo.util.dominator import Dominator
+from pymoo.util.nds.non_dominated_sorting import find_non_dominated
 from pymoo.core.individual import Individual
 # modified Tchebycheff approach
 from moo_algs.tchebicheff import Tchebicheff2
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    # numba is optional, without it the vectorised NumPy code paths are used instead
+    # of the kernels below
+    HAS_NUMBA = False
 
-def normalize_pop(pop):
-    pop_obj = pop.get("F")
-    pc_size, nobj = pop_obj.shape
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
-    fmax = np.max(pop_obj, axis=0)   # max of each column
-    fmin = np.min(pop_obj, axis=0)
+    prange = range
 
-    for i in range(nobj):
-        if fmax[i] == fmin[i]:
-            for row in pop_obj:
-                row[i] = 0.0
 
-        else:
-            for row in pop_obj:
-                row[i] = (row[i] - fmin[i]) / (fmax[i] - fmin[i])
+def normalize_pop(pop_obj):
 
-    pop.set("F", pop_obj)
+    fmax = np.max(pop_obj, axis=0)   # max of each column
+    fmin = np.min(pop_obj, axis=0)
+    span = fmax - fmin
+    mask = span > 0
 
-    return pop
+    # objectives with the same value over the whole population are set to 0
+    norm_obj = np.zeros_like(pop_obj)
+    norm_obj[:, mask] = (pop_obj[:, mask] - fmin[mask]) / span[mask]
 
+    return norm_obj
 
-def normalize_bothpop(pc_pop, npc_pop):
-    PCObj = pc_pop.get("F")
-    NPCObj = npc_pop.get("F")
 
-    pc_size = PCObj.shape[0]
-    npc_size = NPCObj.shape[0]
-    nobj = PCObj.shape[1]
+def normalize_bothpop(PCObj, NPCObj):
 
     fmax = np.max(PCObj, axis=0)   # max of each column
     fmin = np.min(PCObj, axis=0)
+    span = fmax - fmin
 
-    for i in range(nobj):
-        if fmax[i] == fmin[i]:
-            for row in PCObj:
-                row[i] = 0.0
-            for row in NPCObj:
-                row[i] = row[i] - fmin[i]
+    # for objectives with the same value over the PC population, the PC individuals
+    # are set to 0 and the NPC individuals are only shifted by fmin
+    safe_span = np.where(span == 0, 1.0, span)
 
-        else:
-            for row in PCObj:
-                row[i] = (row[i] - fmin[i]) / (fmax[i] - fmin[i])
-
-            for row in NPCObj:
-                row[i] = (row[i] - fmin[i]) / (fmax[i] - fmin[i])
-
-    pc_pop.set("F", PCObj)
-    npc_pop.set("F", NPCObj)
+    # normalise both populations in one sweep and split the result into row views
+    pc_size = PCObj.shape[0]
+    BothObj = np.concatenate([PCObj, NPCObj], axis=0)
+    BothObj -= fmin
+    BothObj /= safe_span
+    BothObj[:pc_size, span == 0] = 0.0
 
-    return pc_pop, npc_pop
+    return BothObj[:pc_size], BothObj[pc_size:]
 
 
 def determine_radius(d, pc_size, pc_capacity):
     k_closest = 3
+    size = min(k_closest, pc_size)
 
-    # record the distance of the individual to its kth closest individual
-    closest_dist = np.zeros((pc_size, k_closest))
-    closest_dist = np.full((pc_size, k_closest), np.inf)
+    # record the distance of each individual to its 1st, ..., kth closest individual;
+    # only the k smallest entries of each row are needed, so partition before sorting
+    closest_dist = np.sort(np.partition(d, size - 1, axis=1)[:, :size], axis=1)
 
     # record the average distance of an individual to its kth closest individual in the population
-    ave_dist = np.zeros(k_closest)
-    d = np.sort(d)
-    size = min(k_closest, pc_size)
-    closest_dist = d[:, :size]
     ave_dist = np.mean(closest_dist, axis=0)
 
-    j = size - 1
-    radius = ave_dist[j]
-    while ave_dist[j] == np.inf:
-        j -= 1
-        radius = ave_dist[j]
+    # use the largest k for which the average distance is finite
+    finite = np.isfinite(ave_dist)
+    radius = ave_dist[finite][-1] if finite.any() else 0.0
 
     return radius
 
 
-def update_PCpop(pc_pop, off):
-
-    pc_objs = pc_pop.get("F")
-    off_objs = off.get("F")
-    n = pc_objs.shape[0]
-
-    del_ind = []
-
+@njit(cache=True)
+def _scan_dominance(off, pc):
+    # returns whether a PC individual dominates off, together with a mask of
+    # the PC individuals that off dominates
+    n, m = pc.shape
+    dominated = np.zeros(n, dtype=np.bool_)
     for i in range(n):
-        flag = Dominator.get_relation(off_objs[0, :], pc_objs[i, :])
-        if flag == 1:
-            # off dominates pc_pop[i]
-            del_ind.append(i)
-            break
-
-        elif flag == -1:
-            # pc_pop[i] dominates off
-            return pc_pop
-        else:
-            # flag == 0
-            # off and pc_pop[i] are nondominated
-            break
-
-    if len(del_ind) > 0:
-        pc_index = np.arange(n)
-        # Delete element at index positions given by the list 'del_ind'
-        pc_index = np.delete(pc_index, del_ind)
-        pc_pop = pc_pop[pc_index.tolist()]
+        lt = 0
+        gt = 0
+        for k in range(m):
+            if off[k] < pc[i, k]:
+                lt += 1
+            elif off[k] > pc[i, k]:
+                gt += 1
+        if lt == 0 and gt > 0:
+            return True, dominated
+        if gt == 0 and lt > 0:
+            dominated[i] = True
+    return False, dominated
+
+
+def scan_dominance(off, pc):
+    if HAS_NUMBA:
+        return _scan_dominance(off, pc)
+    better = np.any(off < pc, axis=1)
+    worse = np.any(off > pc, axis=1)
+    if np.any(worse & ~better):
+        return True, np.zeros(len(pc), dtype=bool)
+    return False, better & ~worse
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _niche_counts(PC, NPC, r2):
+    # count how many NPC individuals are located within the squared radius r2 of each PC individual
+    n, m = PC.shape
+    p = NPC.shape[0]
+    out = np.zeros(n, np.int64)
+    for i in prange(n):
+        c = 0
+        for j in range(p):
+            s = 0.0
+            for k in range(m):
+                d = PC[i, k] - NPC[j, k]
+                s += d * d
+                if s > r2:
+                    break
+            if s <= r2:
+                c += 1
+        out[i] = c
+    return out
+
+
+def niche_counts(PC, NPC, r):
+    # count how many NPC individuals are located within the radius r of each PC individual
+    if HAS_NUMBA:
+        return _niche_counts(PC, NPC, r * r)
+    return np.count_nonzero(cdist(PC, NPC, 'euclidean') <= r, axis=1)
+
+
+# pc_objs holds the objective values of pc_pop and is returned updated along with it
+def update_PCpop(pc_pop, pc_objs, off, off_objs):
+
+    is_dominated, dominated = scan_dominance(off_objs, pc_objs)
+
+    if is_dominated:
+        # a PC individual dominates off
+        return pc_pop, pc_objs
+
+    if np.any(dominated):
+        # off dominates these PC individuals, drop them with a boolean mask
+        keep = ~dominated
+        pc_pop = pc_pop[keep]
+        pc_objs = pc_objs[keep]
 
     pc_pop = Population.merge(pc_pop, off)
+    pc_objs = np.vstack([pc_objs, off_objs])
 
-    return pc_pop
+    return pc_pop, pc_objs
+
+
+@njit(fastmath=True, cache=True)
+def tchebicheff2_values(F, W, z):
+    # modified Tchebycheff values max_k |F_k - z_k| / W_k, see Tchebicheff2;
+    # F holds either one row per weight vector in W or a single row used for all of them
+    n, m = W.shape
+    single = F.shape[0] == 1
+    out = np.empty(n)
+    for i in range(n):
+        fi = 0 if single else i
+        best = 0.0
+        for k in range(m):
+            w = W[i, k]
+            if w == 0:
+                w = 0.00001
+            v = abs(F[fi, k] - z[k]) / w
+            if v > best:
+                best = v
+        out[i] = best
+    return out
+
+
+def decompose(decomp, F, weights, ideal_point):
+    # the default modified Tchebycheff approach is evaluated by the kernel above when numba
+    # is available, any other decomposition (or no numba) goes through pymoo
+    if HAS_NUMBA and type(decomp) is Tchebicheff2 and getattr(decomp, "eps", 0.0) == 0.0:
+        F = np.ascontiguousarray(F, dtype=np.float64).reshape(-1, weights.shape[1])
+        return tchebicheff2_values(F, np.ascontiguousarray(weights, dtype=np.float64),
+                                   np.asarray(ideal_point, dtype=np.float64))
+    return decomp.do(F=F, weights=weights, ideal_point=ideal_point)
 
 
 # update the NPC population by the individual from the PC evolution
-def update_NPCpop(npc_pop, off, ideal_point, ref_dirs, decomp):
+# npc_objs holds the objective values of npc_pop and is updated in place along with it
+def update_NPCpop(npc_pop, npc_objs, off, off_objs, ideal_point, ref_dirs, decomp):
 
     # calculate the decomposed values for each individual in NPC population
 
-    FV = decomp.do(F=npc_pop.get("F"), weights=ref_dirs,
-                   ideal_point=ideal_point)
+    FV = decompose(decomp, npc_objs, ref_dirs, ideal_point)
 
-    off_FV = decomp.do(F=off.get("F"), weights=ref_dirs,
-                       ideal_point=ideal_point)
+    off_FV = decompose(decomp, off_objs, ref_dirs, ideal_point)
 
     # get the absolute index in F where offspring is better than the current F (decomposed space)
     I = np.where(off_FV < FV)[0]
@@ -161,79 +228,72 @@ def update_NPCpop(npc_pop, off, ideal_point, ref_dirs, decomp):
     if len(I) > 0:
         i = np.random.permutation(I)[0]
         npc_pop[i] = off[0]
+        npc_objs[i] = off_objs
 
     return npc_pop
 
-def maintain_PCpop(PCPop, pc_capacity):
+def maintain_PCpop(PCPop, PCObj, pc_capacity):
 
-    pc_pop = PCPop.copy(deep=True)
-    # Normalise the PC poulation
-    pc_pop = normalize_pop(pc_pop)
+    # Normalise the objective values of the PC poulation
+    PCObj = normalize_pop(PCObj)
 
     ######################################################
     # Calculate the Euclidean distance among individuals
     ######################################################
 
-    pc_size = len(pc_pop)
-    PCObj = pc_pop.get("F")
+    pc_size = PCObj.shape[0]
 
-    distance = np.zeros((pc_size, pc_size))
-    distance = cdist(PCObj, PCObj, 'euclidean')
+    # pdist only computes each pair once, squareform mirrors it into the symmetric matrix
+    distance = squareform(pdist(PCObj, 'euclidean'))
+    # an individual is not its own neighbour, nor are individuals with identical objective values
     distance[distance == 0] = np.inf
 
     # calculate the radius for population maintenance
     radius = determine_radius(distance, pc_size, pc_capacity)
 
-    # initialisation of PC individuals' crowding degree
-    crowd_degree = np.ones(pc_size)
+    # contribution of each neighbour to the crowding degree of an individual;
+    # the crowding degree of an individual is 1 - prod(contrib) over its remaining neighbours
+    within = distance < radius
+    contrib = np.where(within, distance / radius, 1)
+    crowd_degree = 1 - np.prod(contrib, axis=1)
+
+    # alive: individuals that have not been removed from the PC population
+    alive = np.ones(pc_size, dtype=bool)
     current_size = pc_size
 
     while current_size > pc_capacity:
-        max_crowding = -1
-        del_ind = np.array([])
-        pc_index = np.arange(current_size)
-
-        d = np.where(distance < radius, distance / radius, 1)
-        crowd_degree = 1 - np.prod(d, axis=1)
+        pc_index = np.nonzero(alive)[0]
 
         # find the individual with the highest crowding degree in the current PC population
-        max_crowding = np.amax(crowd_degree)
+        max_crowding = np.amax(crowd_degree[pc_index])
 
         if max_crowding == 0:
             # this means that all the remaining individuals are not neighboring to each other
             # in this case, randomly remove some until the PC size reduces to the capacity
 
-            if current_size > pc_capacity:
-                # record individual that should be removed from the PC population
-                num = current_size - pc_capacity
-                del_ind = np.random.permutation(pc_index)[:num]
-
-            # delete element at index positions given by the list 'del_ind'
-            pc_index = np.delete(pc_index, del_ind)
-
-            pc_pop = pc_pop[pc_index.tolist()]
-            PCPop = PCPop[pc_index.tolist()]
+            # record individual that should be removed from the PC population
+            num = current_size - pc_capacity
+            del_ind = np.random.permutation(pc_index)[:num]
+            alive[del_ind] = False
 
             current_size = pc_capacity
 
         else:
-            index = np.where(crowd_degree == np.amax(
-                crowd_degree))  # (array([3]),)
-
             # record individual that should be removed from the PC population
-            del_ind = index[0][0]
-
-            distance = np.delete(distance, del_ind, axis=0)
-            distance = np.delete(distance, del_ind, axis=1)
-
-            # delete element at index positions given by the list 'del_ind'
-            pc_index = np.delete(pc_index, del_ind)
+            del_ind = pc_index[int(np.argmax(crowd_degree[pc_index]))]
+            alive[del_ind] = False
 
-            pc_pop = pc_pop[pc_index.tolist()]
-            PCPop = PCPop[pc_index.tolist()]
+            # only the individuals that had it within their radius change their crowding degree;
+            # their products are recomputed over the remaining individuals, so the values (and ties)
+            # are exactly those of a rebuilt distance matrix
+            rows = np.flatnonzero(alive & within[:, del_ind])
+            if len(rows) > 0:
+                crowd_degree[rows] = 1 - np.prod(contrib[np.ix_(rows, alive)], axis=1)
 
             current_size -= 1
 
+    PCPop = PCPop[np.nonzero(alive)[0].tolist()]
+
     return PCPop
 
 
@@ -253,15 +313,19 @@ class NeighborhoodSelection(Selection):
             k = np.random.permutation(len(pop))[:n_select]
         assert len(k) == n_select
 
+        k = np.asarray(k)
         N = self.neighbors
-        P = np.full((n_select, n_parents), -1)
 
-        for i, j in enumerate(k):
+        # decide for all rows at once whether parents are taken from the neighborhood
+        use_neighbors = np.random.random(n_select) < self.prob
+
+        # random picks without replacement: the n_parents smallest of uniform random keys per row
+        nb_cols = np.argpartition(np.random.random((n_select, N.shape[1])), n_parents - 1, axis=1)[:, :n_parents]
+        nb = np.take_along_axis(N[k], nb_cols, axis=1)
+
+        gl = np.argpartition(np.random.random((n_select, len(pop))), n_parents - 1, axis=1)[:, :n_parents]
 
-            if np.random.random() < self.prob:
-                P[i] = np.random.choice(N[j], n_parents, replace=False)
-            else:
-                P[i] = np.random.permutation(len(pop))[:n_parents]
+        P = np.where(use_neighbors[:, None], nb, gl)
 
         return P
 
@@ -281,6 +345,7 @@ class BCEMOEAD(GeneticAlgorithm):
                  crossover=SimulatedBinaryCrossover(prob=1.0, eta=20),
                  mutation=PolynomialMutation(prob=None, eta=20),
                  display=MultiObjectiveDisplay(),
+                 npc_batch_size=1,
                  **kwargs):
         """
         Parameters
@@ -290,6 +355,7 @@ class BCEMOEAD(GeneticAlgorithm):
         decomposition
         prob_neighbor_mating
         display
+        npc_batch_size
         kwargs
         """
 
@@ -299,11 +365,20 @@ class BCEMOEAD(GeneticAlgorithm):
         self.npc_pop = Population.new()
         self.n_neighbors = min(len(ref_dirs), n_neighbors)
         self.prob_neighbor_mating = prob_neighbor_mating
+        self.npc_batch_size = max(1, int(npc_batch_size))
         self.decomp = decomposition
 
+        # scratch buffers for the PC distance matrix and its zero mask, reused across generations
+        self._scratch_buffers = {}
+
         # initialise the neighborhood of subproblems based on the distances of weight vectors
-        self.neighbors = np.argsort(cdist(
-            self.ref_dirs, self.ref_dirs), axis=1, kind='quicksort')[:, :self.n_neighbors]
+        # only the n_neighbors closest weight vectors are needed, so partition the distances
+        # first and sort just those entries of each row
+        D = cdist(self.ref_dirs, self.ref_dirs)
+        idx = np.argpartition(D, self.n_neighbors - 1, axis=1)[:, :self.n_neighbors]
+        rows = np.arange(D.shape[0])[:, None]
+        order = np.argsort(D[rows, idx], axis=1, kind='quicksort')
+        self.neighbors = idx[rows, order]
 
         self.selection = NeighborhoodSelection(
             self.neighbors, prob=prob_neighbor_mating)
@@ -318,7 +393,8 @@ class BCEMOEAD(GeneticAlgorithm):
 
     def _initialize_advance(self, infills=None, **kwargs):
         super()._initialize_advance(infills, **kwargs)
-        self.ideal = np.min(self.pop.get("F"), axis=0)
+        # the ideal point is owned by the algorithm and updated in place by np.minimum
+        self.ideal = np.min(self.pop.get("F"), axis=0).astype(np.float64)
 
         # retrieve the current population
         self.npc_pop = self.pop.copy(deep=True)
@@ -326,12 +402,19 @@ class BCEMOEAD(GeneticAlgorithm):
         # get the objective space values and objects
         npc_objs = self.npc_pop.get("F")
 
-        fronts, rank = NonDominatedSorting().do(npc_objs, return_rank=True)
-        front_0_index = fronts[0]
+        # only the first front is needed, so extract the nondominated individuals directly
+        front_0_index = find_non_dominated(npc_objs)
 
         # put the nondominated individuals of the NPC population into the PC population
         self.pc_pop = self.npc_pop[front_0_index].copy(deep=True)
 
+    def _scratch(self, name, shape, dtype=np.float64):
+        # return the cached buffer, reallocating it only when the PC size changes
+        buf = self._scratch_buffers.get(name)
+        if buf is None or buf.shape != shape:
+            buf = self._scratch_buffers[name] = np.empty(shape, dtype=dtype)
+        return buf
+
     def _infill(self):
         # MOEA\D inherits from genetic algorithm but does not implement the infill/advance interface
         pass
@@ -339,27 +422,28 @@ class BCEMOEAD(GeneticAlgorithm):
     def _advance(self, **kwargs):
         repair, crossover, mutation = self.repair, self.mating.crossover, self.mating.mutation
 
-        pc_pop = self.pc_pop.copy(deep=True)
-        npc_pop = self.npc_pop.copy(deep=True)
+        # the objective values are retrieved once per generation and kept in sync with
+        # the PC and NPC populations below, instead of calling get("F") for every offspring
+        pc_pop = self.pc_pop
+        pc_F = np.ascontiguousarray(self.pc_pop.get("F"), dtype=np.float64)
+        npc_F = np.ascontiguousarray(self.npc_pop.get("F"), dtype=np.float64)
 
         ##############################################################
         # PC evolving
         ##############################################################
 
         # Normalise both poulations according to the PC individuals
-        pc_pop, npc_pop = normalize_bothpop(pc_pop, npc_pop)
+        PCObj, NPCObj = normalize_bothpop(pc_F, npc_F)
 
-        PCObj = pc_pop.get("F")
-        NPCObj = npc_pop.get("F")
         pc_size = PCObj.shape[0]
-        npc_size = NPCObj.shape[0]
 
         ######################################################
         # Calculate the Euclidean distance among individuals
         ######################################################
-        d = np.zeros((pc_size, pc_size))
-        d = cdist(PCObj, PCObj, 'euclidean')
-        d[d == 0] = np.inf
+        d = cdist(PCObj, PCObj, 'euclidean', out=self._scratch("d", (pc_size, pc_size)))
+        # an individual is not its own neighbour, nor are individuals with identical objective values
+        zero = np.equal(d, 0, out=self._scratch("d_zero", (pc_size, pc_size), bool))
+        np.copyto(d, np.inf, where=zero)
 
         # Determine the size of the niche
         if pc_size == 1:
@@ -377,19 +461,12 @@ class BCEMOEAD(GeneticAlgorithm):
         # promising_num: record how many promising individuals in PC
         promising_num = 0
         # count: record how many NPC individuals are located in each PC individual's niche
-        count = np.array([])
-
-        d2 = np.zeros((pc_size, npc_size))
-        d2 = cdist(PCObj, NPCObj, 'euclidean')
-
-        # Count of True elements in each row (each individual in PC) of 2D Numpy Array
-        count = np.count_nonzero(d2 <= r, axis=1)
+        # (without materialising the PC-NPC distance matrix when numba is available)
+        count = niche_counts(PCObj, NPCObj, r)
 
         # Check if the niche has no NPC individual or has only one NPC individual
         # Record the indices of promising individuals.
-        # Since np.nonzero() returns a tuple of arrays, we change the type of promising_index to a numpy.ndarray.
-        promising_index = np.nonzero(count <= 1)
-        promising_index = np.asarray(promising_index).flatten()
+        promising_index = np.flatnonzero(count <= 1)
 
         # Record total number of promising individuals in PC for exploration
         promising_num = len(promising_index)
@@ -402,6 +479,7 @@ class BCEMOEAD(GeneticAlgorithm):
         off = Individual()
 
         if promising_num > 0:
+            offs = []
             for i in range(promising_num):
                 if original_size > 1:
                     parents = Population.new(2)
@@ -426,50 +504,66 @@ class BCEMOEAD(GeneticAlgorithm):
                 else:
                     off = pc_pop[0]
 
-                # mutation
-                off = Population.create(off)
-                off = mutation.do(self.problem, off)
+                offs.append(off)
+
+            # mutate and evaluate all the offspring at once, since they only depend on
+            # the PC population at the start of this generation
+            offs = Population.create(*offs)
+            offs = mutation.do(self.problem, offs)
+            self.evaluator.eval(self.problem, offs)
+            offs_F = np.asarray(offs.get("F"), dtype=np.float64)
 
-                # evaluate the offspring
-                self.evaluator.eval(self.problem, off)
+            # update the populations by the offspring one by one
+            for i in range(promising_num):
+                off = offs[[i]]
+                off_F = offs_F[i]
 
                 # update the PC population by the offspring
-                self.pc_pop = update_PCpop(self.pc_pop, off)
+                self.pc_pop, pc_F = update_PCpop(self.pc_pop, pc_F, off, off_F)
 
                 # update the ideal point
-                self.ideal = np.min(
-                    np.vstack([self.ideal, off.get("F")]), axis=0)
+                np.minimum(self.ideal, off_F, out=self.ideal)
 
                 # update at most one solution in NPC population
-                self.npc_pop = update_NPCpop(self.npc_pop, off, self.ideal,
+                self.npc_pop = update_NPCpop(self.npc_pop, npc_F, off, off_F, self.ideal,
                                              self.ref_dirs, self.decomp)
 
         ########################################################
         # NPC evolution based on MOEA/D
         ########################################################
 
-        # iterate for each member of the population in random order
-        for i in np.random.permutation(len(self.npc_pop)):
+        # iterate for each member of the population in random order, in micro-batches of
+        # npc_batch_size subproblems: the offspring of a batch are mated from the same NPC
+        # population and evaluated together, then the updates are applied one by one
+        order = np.random.permutation(len(self.npc_pop))
+
+        for start in range(0, len(order), self.npc_batch_size):
+            block = order[start:start + self.npc_batch_size]
+
             # get the parents using the neighborhood selection
             P = self.selection.do(
-                self.npc_pop, 1, self.mating.crossover.n_parents, k=[i])
+                self.npc_pop, len(block), self.mating.crossover.n_parents, k=block)
 
             # perform a mating using the default operators (recombination & mutation) - if more than one offspring just pick the first
-            off = self.mating.do(self.problem, self.npc_pop, 1, parents=P)[0]
-
-            off = Population.create(off)
+            offs = Population.create(*[self.mating.do(self.problem, self.npc_pop, 1, parents=P[[b]])[0]
+                                       for b in range(len(block))])
 
             # evaluate the offspring
-            self.evaluator.eval(self.problem, off, algorithm=self)
+            self.evaluator.eval(self.problem, offs, algorithm=self)
+            offs_F = np.asarray(offs.get("F"), dtype=np.float64)
 
-            # update the PC population by the offspring
-            self.pc_pop = update_PCpop(self.pc_pop, off)
+            for b, i in enumerate(block):
+                off = offs[[b]]
+                off_F = offs_F[b]
 
-            # update the ideal point
-            self.ideal = np.min(np.vstack([self.ideal, off.get("F")]), axis=0)
+                # update the PC population by the offspring
+                self.pc_pop, pc_F = update_PCpop(self.pc_pop, pc_F, off, off_F)
 
-            # now actually do the replacement of the individual is better
-            self.npc_pop = self._replace(i, off)
+                # update the ideal point
+                np.minimum(self.ideal, off_F, out=self.ideal)
+
+                # now actually do the replacement of the individual is better
+                self.npc_pop = self._replace(i, off, npc_F, off_F)
 
         ########################################################
         # population maintenance operation in the PC evolution
@@ -488,18 +582,18 @@ class BCEMOEAD(GeneticAlgorithm):
             # get the objective space values and objects
             pc_objs = pc_pop.get("F")
 
-            fronts, rank = NonDominatedSorting().do(pc_objs, return_rank=True)
-            front_0_index = fronts[0]
+            # only the first front is needed, so extract the nondominated individuals directly
+            front_0_index = find_non_dominated(pc_objs)
 
             # put the nondominated individuals of the NPC population into the PC population
             self.pc_pop = pc_pop[front_0_index]
 
             if len(self.pc_pop) > self.pc_capacity:
-                self.pc_pop = maintain_PCpop(self.pc_pop, self.pc_capacity)
+                self.pc_pop = maintain_PCpop(self.pc_pop, pc_objs[front_0_index], self.pc_capacity)
 
         self.pop = self.pc_pop.copy(deep=True)
 
-    def _replace(self, i, off):
+    def _replace(self, i, off, npc_objs, off_objs):
 
         npc_pop = self.npc_pop
 
@@ -509,16 +603,17 @@ class BCEMOEAD(GeneticAlgorithm):
         # calculate the decomposed values for each neighbor
         N = self.neighbors[i]
 
-        FV = self.decomp.do(npc_pop[N].get(
-            "F"), weights=self.ref_dirs[N, :], ideal_point=self.ideal)
-        off_FV = self.decomp.do(
-            off.get("F"), weights=self.ref_dirs[N, :], ideal_point=self.ideal)
+        W = self.ref_dirs[N, :]
+
+        FV = decompose(self.decomp, npc_objs[N], W, self.ideal)
+        off_FV = decompose(self.decomp, off_objs, W, self.ideal)
 
         # get the absolute index in F where offspring is better than the current F (decomposed space)
         I = np.where(off_FV < FV)[0]
 
         if len(I) > 0:
             npc_pop[N[I[:nr]]] = off[0]
+            npc_objs[N[I[:nr]]] = off_objs
 
         return npc_pop
 
@@ -733,6 +733,7 @@ if __name__ == "__main__":
         alg_specific_args = MOO_CONFIG["alg_specific_args"]["BCE-MOEAD"]
         n_neighbors = alg_specific_args["n_neighbors"]
         prob_neighbor_mating = alg_specific_args["prob_neighbor_mating"]
+        npc_batch_size = alg_specific_args.get("npc_batch_size", 1)
         #################
         # set algorithm #
         #################
@@ -743,6 +744,7 @@ if __name__ == "__main__":
             prob_neighbor_mating=prob_neighbor_mating,
             crossover=get_crossover(crossover_func, **crossover_func_args),
             mutation=get_mutation(mutation_func, **mutation_func_args),
+            npc_batch_size=npc_batch_size,
         )
         #####################
         # algorithm logging #
@@ -754,6 +756,7 @@ if __name__ == "__main__":
             "prob_neighbor_mating = {}\n"
             "crossover=get_crossover({},{}),\n"
             "mutation=get_mutation({},{}),\n"
+            "npc_batch_size = {}\n"
             ")".format(
                 alg_name,
                 ref_dir_func, ref_dir_func_args,
@@ -761,6 +764,7 @@ if __name__ == "__main__":
                 prob_neighbor_mating,
                 crossover_func, crossover_func_args,
                 mutation_func, mutation_func_args,
+                npc_batch_size,
             )
         )
 